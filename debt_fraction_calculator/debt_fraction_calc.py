@@ -9,7 +9,7 @@ Workflow to calculate debt fractions based on ATB data
 
 Developed against PySAM 4.0.0
 """
-from typing import TypedDict, List, Dict, Type
+from typing import TypedDict, List
 import pandas as pd
 import click
 
@@ -17,9 +17,8 @@ import PySAM.Levpartflip as levpartflip
 
 from lcoe_calculator.extractor import Extractor
 from lcoe_calculator.config import YEARS, FINANCIAL_CASES, CrpChoiceType, PTC_PLUS_ITC_CASE_PVB
-from lcoe_calculator.tech_processors import LCOE_TECHS
+from lcoe_calculator.tech_processors import LCOE_TECHS, TECH_MAP
 import lcoe_calculator.tech_processors
-from lcoe_calculator.base_processor import TechProcessor
 from lcoe_calculator.macrs import MACRS_6, MACRS_16, MACRS_21
 
 
@@ -213,7 +212,7 @@ def calculate_debt_fraction(input_vals: InputVals, debug=False) -> float:
     return model.Outputs.debt_fraction
 
 
-tech_names = [Tech.__name__ for Tech in LCOE_TECHS]
+tech_names = tuple(Tech.__name__ for Tech in LCOE_TECHS)
 
 @click.command
 @click.argument('data_workbook_filename', type=click.Path(exists=True))
@@ -230,8 +229,7 @@ def calculate_all_debt_fractions(data_workbook_filename: str, output_filename: s
     DATA_WORKBOOK_FILENAME - Path and name of ATB data workbook XLXS file.
     OUTPUT_FILENAME - File to save calculated debt fractions to. Should end with .csv
     """
-    tech_map: Dict[str, Type[TechProcessor]] = {tech.__name__: tech for tech in LCOE_TECHS}
-    techs = LCOE_TECHS if tech is None else [tech_map[tech]]
+    techs = LCOE_TECHS if tech is None else [TECH_MAP[tech]]
 
     df_itc, df_ptc = Extractor.get_tax_credits_sheet(data_workbook_filename)
 
@@ -15,7 +15,7 @@ import numpy as np
 from .macrs import MACRS_6
 from .extractor import Extractor
 from .abstract_extractor import AbstractExtractor
-from .config import FINANCIAL_CASES, END_YEAR, TECH_DETAIL_SCENARIO_COL, MARKET_FIN_CASE, CRP_CHOICES,\
+from .config import FINANCIAL_CASES, END_YEAR, MARKET_FIN_CASE, CRP_CHOICES,\
     SCENARIOS, LCOE_SS_NAME, CAPEX_SS_NAME, CFF_SS_NAME, CrpChoiceType, BASE_YEAR
 
 
@@ -54,14 +54,14 @@ class TechProcessor(ABC):
 
     # ------------ All other attributes have defaults -------------------------
     # Metrics to load from SS. Format: (header in SS, object attribute name)
-    metrics: List[Tuple[str, str]] = [
+    metrics: Tuple[Tuple[str, str], ...] = (
         ('Net Capacity Factor (%)', 'df_ncf'),
         ('Overnight Capital Cost ($/kW)', 'df_occ'),
         ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
         ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
         ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
         (CFF_SS_NAME, 'df_cff'),
-    ]
+    )
 
     tech_life = 30  # Tech lifespan in years
     num_tds = 10  # Number of technical resource groups
@@ -82,7 +82,7 @@ class TechProcessor(ABC):
     # flat file). Any attributes that are None are silently ignored. Financial
     # assumptions values are added automatically.
     # See https://atb.nrel.gov/electricity/2023/acronyms or below for acronym definitions
-    flat_attrs: List[Tuple[str, str]] = [
+    flat_attrs: Tuple[Tuple[str, str], ...] = (
         ('df_ncf', 'CF'),
         ('df_occ', 'OCC'),
         ('df_gcc', 'GCC'),
@@ -91,7 +91,7 @@ class TechProcessor(ABC):
         ('df_cfc', 'CFC'),
         ('df_lcoe', 'LCOE'),
         ('df_capex', 'CAPEX'),
-    ]
+    )
 
     # Variables used by the debt fraction calculator. Should be filled out for any tech
     # where self.has_lcoe == True.
@@ -154,6 +154,8 @@ class TechProcessor(ABC):
         self.df_pff = None  # Project finance factor (unitless)
         self.df_lcoe = None  # LCOE ($/MWh)
 
+        self._fin_vals = {}  # Financial assumptions from df_fin, by name
+
         self._ExtractorClass = extractor
         self._extractor = self._extract_data()
 
@@ -184,36 +186,56 @@ class TechProcessor(ABC):
 
         @returns Flat data for tech
         """
-        df_flat = pd.DataFrame() if self.df_wacc is None else self._flat_fin_assump()
+        # Collect all frames and concatenate once at the end
+        frames = [] if self.df_wacc is None else [self._flat_fin_assump()]
 
         case = self._case.upper()
         if case == 'MARKET':
             case = MARKET_FIN_CASE
 
+        # Outputs normally share the same index, so split tech detail and scenario for the first
+        # output and only split again when the index changes
+        split_index = getattr(self, self.flat_attrs[0][0]).index
+        display_names, scenario_names = self._split_tech_detail_scenario(split_index)
         for attr, parameter in self.flat_attrs:
             df = getattr(self, attr)
-            df = df.reset_index()
-
-            old_cols = df.columns
-            df[['DisplayName', 'Scenario']] = df[TECH_DETAIL_SCENARIO_COL].str\
-                .rsplit('/', n=1, expand=True)
-            df.DisplayName = df.DisplayName.str.strip()
-            df.Scenario = df.Scenario.str.strip()
-            df['Parameter'] = parameter
-            df_flat = pd.concat([df_flat, df])
-
+            if not df.index.equals(split_index):
+                split_index = df.index
+                display_names, scenario_names = self._split_tech_detail_scenario(split_index)
+
+            # Build the output frame from columns in one go rather than resetting the index and
+            # adding columns one at a time. Take each column separately to keep its dtype.
+            year_cols = list(df.columns)
+            data = {'Parameter': parameter, 'DisplayName': display_names,
+                    'Scenario': scenario_names}
+            data.update((col, df[col].to_numpy()) for col in year_cols)
+            frames.append(pd.DataFrame(data))
+
+        df_flat = pd.concat(frames)
         df_flat['Technology'] = self.tech_name
         df_flat['Case'] = case
         df_flat['CRPYears'] = self._crp_years
         df_flat['TaxCreditCase'] = self._get_tax_credit_case()
 
         new_cols = ['Parameter', 'Case', 'TaxCreditCase', 'CRPYears', 'Technology', 'DisplayName',
-                    'Scenario'] + list(old_cols)
-        df_flat = df_flat[new_cols]
-        df_flat = df_flat.drop(TECH_DETAIL_SCENARIO_COL, axis=1).reset_index(drop=True)
+                    'Scenario'] + year_cols
+        df_flat = df_flat[new_cols].reset_index(drop=True)
 
         return df_flat
 
+    @staticmethod
+    def _split_tech_detail_scenario(index: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split a '{tech detail}/{scenario}' index into display names and scenario names
+
+        @param index - index of an output data frame
+        @returns display names and scenario names
+        """
+        df_split = index.to_series().str.rsplit('/', n=1, expand=True)
+        display_names = df_split[0].str.strip().values
+        scenario_names = df_split[1].str.strip().values
+        return display_names, scenario_names
+
     def get_depreciation_schedule(self, year: int) -> List[float]:
         """
         Provide a function to return the depreciation schedule.  Not used for most techs, but some
@@ -247,8 +269,7 @@ class TechProcessor(ABC):
         assert not self.ss_lcoe.isnull().any().any(),\
             f'Error in LCOE from workbook, found missing values: {self.ss_lcoe}'
 
-        if np.allclose(np.array(self.df_lcoe, dtype=float),
-                       np.array(self.ss_lcoe, dtype=float)):
+        if np.allclose(self.df_lcoe.to_numpy(dtype=float), self.ss_lcoe.to_numpy(dtype=float)):
             print('Calculated LCOE matches LCOE from workbook')
         else:
             msg = f'Calculated LCOE doesn\'t match LCOE from workbook for {self.sheet_name}'
@@ -276,8 +297,7 @@ class TechProcessor(ABC):
             f'Error in calculated CAPEX, found missing values: {self.df_capex}'
         assert not self.ss_capex.isnull().any().any(),\
             f'Error in CAPEX from workbook, found missing values: {self.ss_capex}'
-        if np.allclose(np.array(self.df_capex, dtype=float),
-                       np.array(self.ss_capex, dtype=float)):
+        if np.allclose(self.df_capex.to_numpy(dtype=float), self.ss_capex.to_numpy(dtype=float)):
             print('Calculated CAPEX matches CAPEX from workbook')
         else:
             raise ValueError('Calculated CAPEX doesn\'t match CAPEX from workbook')
@@ -292,21 +312,21 @@ class TechProcessor(ABC):
         assert self.df_wacc is not None, ('df_wacc must not be None to flatten '
             'financial assumptions.')
 
-        df = self.df_wacc.copy()
-
         # Add CRF and FCR
+        frames = [self.df_wacc]
         if self.has_tax_credit and self.df_pff is not None:
             for scenario in self.scenarios:
-                wacc = df.loc[f'WACC Real - {scenario}']
+                wacc = self.df_wacc.loc[f'WACC Real - {scenario}']
                 pff = self.df_pff.loc[f'PFF - {scenario}']
                 crf, fcr = self._calc_fcr(wacc, self._crp_years, pff, scenario)
-                df = pd.concat([df, crf, fcr])
+                frames += [crf, fcr]
         else:
             # No tax credit, just fill with *
-            cols = df.columns
+            cols = self.df_wacc.columns
             fcr = pd.DataFrame({c:['*'] for c in cols}, index=['FCR'])
             crf = pd.DataFrame({c:['*'] for c in cols}, index=['CRF'])
-            df = pd.concat([df, crf, fcr])
+            frames += [crf, fcr]
+        df = pd.concat(frames)
 
         # Explode index and clean up
         df.index.rename('WACC', inplace=True)
@@ -350,16 +370,7 @@ class TechProcessor(ABC):
         extractor = self._ExtractorClass(self._data_workbook_fname, self.sheet_name,
                               self._case, self._requested_crp, self.scenarios, self.base_year)
 
-        print('\tLoading metrics')
-        for metric, var_name in self.metrics:
-            if var_name == 'df_cff':
-                # Grab DF index from another value to use in full CFF DF
-                index = getattr(self, self.metrics[0][1]).index
-                self.df_cff = self.load_cff(extractor, metric, index)
-                continue
-
-            temp = extractor.get_metric_values(metric, self.num_tds, self.split_metrics)
-            setattr(self, var_name, temp)
+        self._load_metrics(extractor)
 
         if self.has_tax_credit:
             self.df_tc = extractor.get_tax_credits()
@@ -368,6 +379,7 @@ class TechProcessor(ABC):
         print('\tLoading assumptions')
         if self.has_fin_assump:
             self.df_fin = extractor.get_fin_assump()
+            self._fin_vals = self.df_fin['Value'].to_dict()
 
         if self.has_wacc:
             print('\tLoading WACC data')
@@ -376,6 +388,25 @@ class TechProcessor(ABC):
         print('\tDone loading data')
         return extractor
 
+    def _load_metrics(self, extractor: Extractor):
+        """
+        Load all metrics in self.metrics from the workbook into their data frame attributes
+
+        @param extractor - workbook extractor instance
+        """
+        print('\tLoading metrics')
+        index = None
+        for metric, var_name in self.metrics:
+            if var_name == 'df_cff':
+                # Use the index of the first metric for the full CFF DF
+                self.df_cff = self.load_cff(extractor, metric, index)
+                continue
+
+            temp = extractor.get_metric_values(metric, self.num_tds, self.split_metrics)
+            if index is None:
+                index = temp.index
+            setattr(self, var_name, temp)
+
     @classmethod
     def load_cff(cls, extractor: Extractor, cff_name: str, index: pd.Index,
                  return_short_df=False) -> pd.DataFrame:
@@ -398,9 +429,7 @@ class TechProcessor(ABC):
             return df_cff
 
         # CFF only has values for the three scenarios. Duplicate for all tech details
-        full_df_cff = pd.DataFrame()
-        for _ in range(cls.num_tds):
-            full_df_cff = pd.concat([full_df_cff, df_cff])
+        full_df_cff = df_cff.iloc[np.tile(np.arange(len(df_cff)), cls.num_tds)]
         full_df_cff.index = index
 
         return full_df_cff
@@ -414,22 +443,19 @@ class TechProcessor(ABC):
         assert self.df_cff is not None and self.df_occ is not None and\
             self.df_gcc is not None, 'CFF, OCC, and GCC must to loaded to calculate CAPEX'
         df_capex = self.df_cff * (self.df_occ + self.df_gcc)
-        df_capex = df_capex.copy()
         return df_capex
 
     def _calc_con_fin_cost(self):
         df_cfc = (self.df_cff - 1) * (self.df_occ + self.df_gcc)
-        df_cfc = df_cfc.copy()
         return df_cfc
 
     def _calc_crf(self):
-        df_crf = self.df_just_wacc/(1-(1/(1+self.df_just_wacc))**self.crp)
+        # Only the real CRF is used, skip the nominal WACC rows
+        df_real_wacc = self.df_just_wacc.loc[self.df_just_wacc.index.str.contains('Real')]
+        df_crf = df_real_wacc/(1-(1/(1+df_real_wacc))**self.crp)
 
         # Relabel WACC index as CRF
-        df_crf = df_crf.reset_index()
-        df_crf['WACC Type'] = df_crf['WACC Type'].apply(lambda x: 'Capital Recovery Factor (CRF)'+x[4:])
-        df_crf = df_crf.loc[df_crf['WACC Type'].str.contains('Real')]
-        df_crf = df_crf.set_index('WACC Type')
+        df_crf.index = 'Capital Recovery Factor (CRF)' + df_crf.index.str.slice(4)
 
         return df_crf
 
@@ -440,7 +466,7 @@ class TechProcessor(ABC):
 
         @returns: CRP
         """
-        raw_crp = self.df_fin.loc['Capital Recovery Period (Years)', 'Value']
+        raw_crp = self._fin_vals['Capital Recovery Period (Years)']
 
         try:
             crp = float(raw_crp)
@@ -471,28 +497,18 @@ class TechProcessor(ABC):
 
         return itc_schedule
 
-    def _calc_pff(self, itc_type=''):
+    def _calc_pff(self, itc_type='', df_pvd=None):
         """
         Calculate PFF
 
         @param {str} itc_type - type of ITC to search for (used for utility PV + batt)
+        @param {pd.DataFrame|None} df_pvd - present value of depreciation, as returned by
+            _calc_pvd(). Calculated if None.
         @returns {pd.DataFrame} - dataframe of PFF
         """
         df_tax_rate = self.df_wacc.loc['Tax Rate (Federal and State)']
-        inflation = self.df_wacc.loc['Inflation Rate']
-
-        df_pvd = pd.DataFrame(columns=self._tech_years)
-        for scenario in self.scenarios:
-            for year in self._tech_years:
-
-                MACRS_schedule = self.get_depreciation_schedule(year)
-
-                df_depreciation_factor = self._calc_dep_factor(
-                    MACRS_schedule, inflation, scenario
-                )
-
-                df_pvd.loc['PVD - ' + scenario,year] = np.dot(MACRS_schedule,
-                                                              df_depreciation_factor[year])
+        if df_pvd is None:
+            df_pvd = self._calc_pvd()
 
         itc_schedule = self._calc_itc(itc_type=itc_type)
 
@@ -501,25 +517,47 @@ class TechProcessor(ABC):
         df_pff.index = [f'PFF - {scenario}' for scenario in self.scenarios]
         return df_pff
 
-    def _calc_dep_factor(self, MACRS_schedule, inflation, scenario):
+    def _calc_pvd(self):
         """
-        Calculate the depreciation factor
-
-        @param {list of float} MACRS_schedule - MACRS
-        @param {pd.Series} inflation - inflation by year
-        @param {string} scenario - tech scenario
+        Calculate present value of depreciation. This does not depend on the ITC type so it may
+        be shared between multiple PFF calculations.
 
-        @returns {pd.DataFrame} - Depreciation factor. Columns are atb years, rows are
-            depreciation years.
+        @returns {pd.DataFrame} - dataframe of PVD
         """
-        dep_years = len(MACRS_schedule)
-        df_depreciation_factor = pd.DataFrame(columns=self._tech_years)
-        wacc_real = self.df_wacc.loc['WACC Real - ' + scenario]
+        years = list(self._tech_years)
+        inflation = self.df_wacc.loc['Inflation Rate', years].values.astype(float)
+        wacc_real = self.df_wacc.loc[[f'WACC Real - {s}' for s in self.scenarios], years]
+        wacc_real = wacc_real.values.astype(float)
+
+        # Real discount rate for all scenarios (rows) and years (columns)
+        discount = (1 + wacc_real) * (1 + inflation)
+
+        # Most years share the same depreciation schedule. Group years by schedule and calculate
+        # each group at once.
+        year_groups = {}
+        for i, year in enumerate(years):
+            MACRS_schedule = tuple(self.get_depreciation_schedule(year))
+            year_groups.setdefault(MACRS_schedule, []).append(i)
+
+        pvd = np.empty(discount.shape)
+        for MACRS_schedule, cols in year_groups.items():
+            dep_factor = self._calc_dep_factor(len(MACRS_schedule), discount[:, cols])
+            pvd[:, cols] = np.dot(dep_factor, MACRS_schedule)
+
+        df_pvd = pd.DataFrame(pvd, index=[f'PVD - {s}' for s in self.scenarios], columns=years)
+        return df_pvd
 
-        for dep_year in range(dep_years):
-            df_depreciation_factor.loc[dep_year+1] = 1/((1+wacc_real)*(1+inflation))**(dep_year+1)
+    @staticmethod
+    def _calc_dep_factor(dep_years: int, discount: np.ndarray) -> np.ndarray:
+        """
+        Calculate the depreciation factor
 
-        return df_depreciation_factor
+        @param dep_years - number of years in the depreciation schedule
+        @param discount - real discount rate, (1 + WACC real) * (1 + inflation), by scenario
+            and year
+        @returns - Depreciation factor with an added last axis for depreciation years
+        """
+        return 1 / np.power.outer(discount, np.arange(1, dep_years + 1))
 
     def _calc_ptc(self):
         """
@@ -528,19 +566,25 @@ class TechProcessor(ABC):
         @returns {np.ndarray|int} - array of PTC values or 0
         """
         if self.has_tax_credit:
-            df_tax_credit = self.df_tc.reset_index()
-            df_ptc = df_tax_credit.loc[df_tax_credit['Tax Credit'].str.contains('PTC/', na=False)]
-
-            assert len(df_ptc) != 0, f'PTC data is missing for {self.sheet_name}'
-            assert len(df_ptc) == len(self.scenarios), f'Wrong amount of PTC data for{self.sheet_name}'
-
-            df_ptc = pd.concat([df_ptc] * self.num_tds).set_index('Tax Credit')
-            ptc = df_ptc.values
+            ptc = np.tile(self._get_scenario_ptc().to_numpy(dtype=float), (self.num_tds, 1))
         else:
             ptc = 0
 
         return ptc
 
+    def _get_scenario_ptc(self) -> pd.DataFrame:
+        """
+        Get PTC values from the tax credit data, one row per scenario
+
+        @returns {pd.DataFrame} - PTC values indexed by tax credit name
+        """
+        df_ptc = self.df_tc.loc[self.df_tc.index.str.startswith('PTC/', na=False)]
+
+        assert len(df_ptc) != 0, f'PTC data is missing for {self.sheet_name}'
+        assert len(df_ptc) == len(self.scenarios), f'Wrong amount of PTC data for{self.sheet_name}'
+
+        return df_ptc
+
     def _calc_lcoe(self):
         ptc = self._calc_ptc()
 
@@ -548,13 +592,20 @@ class TechProcessor(ABC):
             (f'CRF has {len(self.df_crf)} rows ({self.df_crf.index}), but there '
              f'are {len(self.scenarios)} scenarios ({self.scenarios})')
 
-        x = self.df_crf.values * self.df_pff
-        y = pd.concat([x] * self.num_tds)
+        fcr = self.df_crf.to_numpy(dtype=float) * self.df_pff.to_numpy(dtype=float)
 
-        df_lcoe = (1000 * (y.values * self.df_capex.values + self.df_fom)/
-                self.df_aep.values)
-        df_lcoe = df_lcoe + self.df_vom.values - ptc
+        # FCR is per scenario. View CAPEX as (tech detail, scenario, year) so the FCR broadcasts
+        # across tech details, then update the result in place. Values from the workbook may be
+        # object dtype, so convert to float arrays for the math.
+        capex = self.df_capex.to_numpy(dtype=float).reshape(self.num_tds, len(self.scenarios), -1)
+        lcoe = (fcr * capex).reshape(self.df_capex.shape)
+        lcoe += self.df_fom.to_numpy(dtype=float)
+        lcoe *= 1000
+        lcoe /= self.df_aep.to_numpy(dtype=float)
+        lcoe += self.df_vom.to_numpy(dtype=float)
+        lcoe -= ptc
 
+        df_lcoe = pd.DataFrame(lcoe, index=self.df_fom.index, columns=self.df_fom.columns)
         return df_lcoe
 
     def _get_tax_credit_case(self):
@@ -569,21 +620,23 @@ class TechProcessor(ABC):
         assert len(self.df_tc) > 0, \
             (f'Setup df_tc with extractor.get_tax_credits() before calling this function!')
 
-        ptc = self._calc_ptc()
+        # The PTC is the same for all tech details, so only check the scenario rows
+        ptc = self._get_scenario_ptc().values
         itc = self._calc_itc()
 
         # Trim the 2022 to eliminate pre-inflation reduction act confusion (consider removing in future years)
         ptc = ptc[:, 1:]
         itc = itc[1:]
 
-        ptc_sum = np.sum(ptc)
-        itc_sum = np.sum(itc)
+        # Tax credits are never negative, so any positive value means the credit is active
+        has_ptc = np.any(ptc > 0)
+        has_itc = np.any(itc > 0)
 
-        if ptc_sum > 0 and itc_sum > 0:
+        if has_ptc and has_itc:
             return "PTC + ITC"
-        if ptc_sum > 0:
+        if has_ptc:
             return "PTC"
-        if itc_sum > 0:
+        if has_itc:
             return "ITC"
         else:
             return "None"
\ No newline at end of file
@@ -7,12 +7,12 @@
 """
 Process all (or some) ATB technologies and calculate all metrics.
 """
-from typing import List, Dict, Type
+from typing import List, Optional, Type
 from datetime import datetime as dt
 import click
 import pandas as pd
 
-from .tech_processors import ALL_TECHS
+from .tech_processors import ALL_TECHS, TECH_MAP
 from .base_processor import TechProcessor
 from .config import FINANCIAL_CASES, MARKET_FIN_CASE, CRP_CHOICES, CrpChoiceType, TAX_CREDIT_CASES
 
@@ -30,6 +30,7 @@ class ProcessAll:
         if not isinstance(techs, list):
             techs = [techs]
 
+        self._data_flattened: Optional[pd.DataFrame] = None  # Cached melted flat data
         self.data = pd.DataFrame()  # Flat data
         self.meta = pd.DataFrame()  # Meta data
 
@@ -56,15 +57,13 @@ class ProcessAll:
         if test_lcoe:
             proc.test_lcoe()
 
-        flat = proc.flat
-        self.data = pd.concat([self.data, flat])
-
         return proc
 
     def process(self, test_capex: bool = True, test_lcoe: bool = True):
         """ Process all techs """
-        self.data = pd.DataFrame()
-        self.meta = pd.DataFrame()
+        # Collect output for all techs and concatenate once at the end
+        data_frames = []
+        meta_frames = []
 
         for i, Tech in enumerate(self._techs):
             print(f'##### Processing {Tech.tech_name} ({i+1}/{len(self._techs)}) #####')
@@ -80,25 +79,53 @@ class ProcessAll:
                         tax_cases = TAX_CREDIT_CASES[Tech.tech_name]
                         for tc in tax_cases:
                             proc = self._run_tech(Tech, crp, case, tc, test_capex, test_lcoe)
+                            data_frames.append(proc.flat)
                     else:
                         proc = self._run_tech(Tech, crp, case, None, test_capex, test_lcoe)
+                        data_frames.append(proc.flat)
 
             meta = proc.get_meta_data()
             meta['Tech Name'] = Tech.tech_name
-            self.meta = pd.concat([self.meta, meta])
+            meta_frames.append(meta)
 
-        self.data = self.data.reset_index(drop=True)
-        self.meta = self.meta.reset_index(drop=True)
+        # pd.concat() fails on an empty list, keep empty data frames if there were no techs
+        if data_frames:
+            self.data = pd.concat(data_frames).reset_index(drop=True)
+            self.meta = pd.concat(meta_frames).reset_index(drop=True)
+        else:
+            self.data = pd.DataFrame()
+            self.meta = pd.DataFrame()
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """ Flat data for all processed techs """
+        return self._data
+
+    @data.setter
+    def data(self, data: pd.DataFrame):
+        # Melted data is cached, clear it whenever the flat data is replaced
+        self._data = data
+        self._data_flattened = None
 
     @property
     def data_flattened(self):
-        """ Get flat data pivoted with each year as a row """
-        if self.data is None:
+        """
+        Get flat data pivoted with each year as a row. The melted data is cached until self.data
+        is reassigned. In-place changes to self.data, e.g. drop(..., inplace=True) or .loc
+        assignment, are not detected and the old melted data will be returned. The same cached
+        data frame is returned on every call, copy it before modifying.
+
+        @returns {pd.DataFrame} - melted flat data
+        """
+        if self.data.empty:
             raise ValueError('Please run process() first')
 
-        melted = pd.melt(self.data, id_vars=['Parameter', 'Case', 'TaxCreditCase', 'CRPYears',
-                                             'Technology', 'DisplayName', 'Scenario'])
-        return melted
+        # Melting is relatively slow, only do it once for the current data
+        if self._data_flattened is None:
+            self._data_flattened = self.data.melt(id_vars=['Parameter', 'Case', 'TaxCreditCase',
+                                                           'CRPYears', 'Technology', 'DisplayName',
+                                                           'Scenario'])
+        return self._data_flattened
 
     def to_csv(self, fname: str):
         """ Write data to CSV """
@@ -121,7 +148,7 @@ class ProcessAll:
         self.meta.to_csv(fname)
 
 
-tech_names = [Tech.__name__ for Tech in ALL_TECHS]
+tech_names = tuple(TECH_MAP)
 
 @click.command
 @click.argument('data_workbook_filename', type=click.Path(exists=True))
@@ -140,9 +167,7 @@ def process(data_workbook_filename: str, tech: str|None, meta_file: str|None, fl
     """
     CLI to process ATB data workbook and calculate metrics.
     """
-    tech_map: Dict[str, Type[TechProcessor]] = {tech.__name__: tech for tech in ALL_TECHS}
-
-    techs = ALL_TECHS if tech is None else [tech_map[tech]]
+    techs = ALL_TECHS if tech is None else [TECH_MAP[tech]]
 
     start_dt = dt.now()
     processor = ProcessAll(data_workbook_filename, techs)
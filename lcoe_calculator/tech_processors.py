@@ -7,7 +7,7 @@
 """
 Individual tech processors. See documentation in base_processor.py.
 """
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Type
 import numpy as np
 import pandas as pd
 
@@ -93,8 +93,9 @@ class UtilityPvPlusBatteryProc(TechProcessor):
     GRID_ROUNDTRIP_EFF = 0.85 # Roundtrip Efficiency (Grid charging)
     CO_LOCATION_SAVINGS = 0.9228 # Reduction in OCC from co-locating the PV and battery system on the same site
     BATT_PV_RATIO = 60.0 / 100.0 # Modifier for $/kW to get everything on the same basis
+    _BATT_COST_FACTOR = CO_LOCATION_SAVINGS * BATT_PV_RATIO # Combined modifier for battery costs
 
-    metrics = [
+    metrics = (
         ('Net Capacity Factor (%)', 'df_ncf'),
         ('Overnight Capital Cost ($/kW)', 'df_occ'),
         ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
@@ -104,7 +105,7 @@ class UtilityPvPlusBatteryProc(TechProcessor):
         ('Battery Storage  Cost ($/kW)', 'df_batt_cost'),
         ('Construction Finance Factor', 'df_cff'),
         ('PV-only Capacity Factor (%)','df_pvcf')
-    ]
+    )
 
     def __init__(
         self,
@@ -118,26 +119,50 @@ class UtilityPvPlusBatteryProc(TechProcessor):
         self.df_pv_cost: Optional[pd.DataFrame] = None
         self.df_batt_cost: Optional[pd.DataFrame] = None
 
+        # Project finance factors for PV and battery, calculated in run()
+        self.df_pff_pv: Optional[pd.DataFrame] = None
+        self.df_pff_batt: Optional[pd.DataFrame] = None
+
         super().__init__(data_workbook_fname, case, crp, tcc, extractor)
 
     def _calc_lcoe(self):
-        batt_charge_frac = self.df_fin.loc['Fraction of Battery Energy Charged from PV (75% to 100%)', 'Value']
-        grid_charge_cost = self.df_fin.loc['Average Cost of Battery Energy Charged from Grid ($/MWh)', 'Value']
+        batt_charge_frac = self._fin_vals['Fraction of Battery Energy Charged from PV (75% to 100%)']
+        grid_charge_cost = self._fin_vals['Average Cost of Battery Energy Charged from Grid ($/MWh)']
 
         ptc = self._calc_ptc()
-        ptc_cf_adj = self.df_pvcf / self.df_ncf
-        ptc_cf_adj = ptc_cf_adj.clip(upper=1.0) # account for RTE losses at 100% grid charging (might need to make equation above better)
-
-        fcr_pv = pd.concat([self.df_crf.values * self.df_pff_pv] * self.num_tds).values
-        fcr_batt = pd.concat([self.df_crf.values * self.df_pff_batt] * self.num_tds).values
-
-        df_lcoe_part = (fcr_pv * self.df_cff * (self.df_pv_cost * self.CO_LOCATION_SAVINGS + self.df_gcc))\
-                       + (fcr_batt * self.df_cff * (self.df_batt_cost * self.CO_LOCATION_SAVINGS * self.BATT_PV_RATIO))\
-                       + self.df_fom
-        df_lcoe = (df_lcoe_part * 1000 / self.df_aep)\
-                  + self.df_vom\
-                  + (1 - batt_charge_frac) * grid_charge_cost / self.GRID_ROUNDTRIP_EFF - ptc * ptc_cf_adj
-
+        # account for RTE losses at 100% grid charging (might need to make equation above better)
+        ptc_cf_adj = self.df_pvcf.to_numpy(dtype=float) / self.df_ncf.to_numpy(dtype=float)
+        np.minimum(ptc_cf_adj, 1.0, out=ptc_cf_adj)
+
+        # Fixed charge rates for PV and battery, by scenario and year. Always use the current CRF
+        # and PFFs.
+        assert self.df_crf is not None and self.df_pff_pv is not None and\
+            self.df_pff_batt is not None, 'CRF and PFFs must be calculated before LCOE'
+        crf = self.df_crf.to_numpy(dtype=float)
+        fcr_pv = crf * self.df_pff_pv.to_numpy(dtype=float)
+        fcr_batt = crf * self.df_pff_batt.to_numpy(dtype=float)
+
+        # FCR is per scenario. View the capital costs as (tech detail, scenario, year) so the FCR
+        # broadcasts across tech details instead of being tiled to the full size.
+        shape = (self.num_tds, len(self.scenarios), -1)
+        pv_cost = self.df_pv_cost.to_numpy(dtype=float).reshape(shape)
+        gcc = self.df_gcc.to_numpy(dtype=float).reshape(shape)
+        batt_cost = self.df_batt_cost.to_numpy(dtype=float).reshape(shape)
+
+        # All inputs share the same index, so work on float arrays and update the result in
+        # place rather than creating an intermediate data frame for every operation
+        lcoe = fcr_pv * (pv_cost * self.CO_LOCATION_SAVINGS + gcc)
+        lcoe += fcr_batt * (batt_cost * self._BATT_COST_FACTOR)
+        lcoe = lcoe.reshape(self.df_ncf.shape)
+        lcoe *= self.df_cff.to_numpy(dtype=float)  # CFF applies to PV and battery capital costs
+        lcoe += self.df_fom.to_numpy(dtype=float)
+        lcoe *= 1000
+        lcoe /= self.df_aep.to_numpy(dtype=float)
+        lcoe += self.df_vom.to_numpy(dtype=float)
+        lcoe += (1 - batt_charge_frac) * grid_charge_cost / self.GRID_ROUNDTRIP_EFF
+        lcoe -= ptc * ptc_cf_adj
+
+        df_lcoe = pd.DataFrame(lcoe, index=self.df_ncf.index, columns=self.df_ncf.columns)
         return df_lcoe
 
     def _extract_data(self):
@@ -150,16 +175,7 @@ class UtilityPvPlusBatteryProc(TechProcessor):
                               self._case, self._requested_crp, self.scenarios, self.base_year,
                               self.tax_credit_case)
 
-        print('\tLoading metrics')
-        for metric, var_name in self.metrics:
-            if var_name == 'df_cff':
-                # Grab DF index from another value to use in full CFF DF
-                index = getattr(self, self.metrics[0][1]).index
-                self.df_cff = self.load_cff(extractor, metric, index)
-                continue
-
-            temp = extractor.get_metric_values(metric, self.num_tds, self.split_metrics)
-            setattr(self, var_name, temp)
+        self._load_metrics(extractor)
 
         if self.has_tax_credit:
             self.df_tc = extractor.get_tax_credits()
@@ -168,6 +184,7 @@ class UtilityPvPlusBatteryProc(TechProcessor):
         print('\tLoading assumptions')
         if self.has_fin_assump:
             self.df_fin = extractor.get_fin_assump()
+            self._fin_vals = self.df_fin['Value'].to_dict()
 
         if self.has_wacc:
             print('\tLoading WACC data')
@@ -185,26 +202,24 @@ class UtilityPvPlusBatteryProc(TechProcessor):
         assert len(self.df_tc) > 0, \
             ('Setup df_tc with extractor.get_tax_credits() before calling this function!')
 
-        ptc = self._calc_ptc()
-        # Battery always takes ITC, so PV determines the case
-        pv_itc = self._calc_itc(itc_type=' - PV')
+        # The PTC is the same for all tech details, so only check the scenario rows
+        ptc = self._get_scenario_ptc().values
         batt_itc = self._calc_itc(itc_type= ' - Battery')
 
-        # Trim the first year to eliminate pre-inflation reduction act confusion
-        ptc = ptc[:, 1:]
-        pv_itc = pv_itc[1:]
-        batt_itc = batt_itc[1:]
-
-        ptc_sum = np.sum(ptc)
-        pv_itc_sum = np.sum(pv_itc)
-        batt_itc_sum = np.sum(batt_itc)
+        # Trim the first year to eliminate pre-inflation reduction act confusion. Tax credits are
+        # never negative, so any positive value means the credit is active
+        has_ptc = np.any(ptc[:, 1:] > 0)
+        has_batt_itc = np.any(batt_itc[1:] > 0)
 
-        if ptc_sum > 0 and batt_itc_sum > 0:
+        if not has_batt_itc:
+            return "PTC" if has_ptc else "None"
+        if has_ptc:
             return "PTC + ITC"
-        elif pv_itc_sum > 0 and batt_itc_sum > 0:
+
+        # Battery always takes ITC, so PV determines the case. Only needed if there is no PTC
+        pv_itc = self._calc_itc(itc_type=' - PV')
+        if np.any(pv_itc[1:] > 0):
             return "ITC"
-        elif ptc_sum > 0:
-            return "PTC"
         else:
             return "None"
 
@@ -216,8 +231,10 @@ class UtilityPvPlusBatteryProc(TechProcessor):
         self.df_cfc = self._calc_con_fin_cost()
 
         self.df_crf = self._calc_crf()
-        self.df_pff_pv = self._calc_pff(itc_type=' - PV')
-        self.df_pff_batt = self._calc_pff(itc_type=' - Battery')
+        # Depreciation is the same for PV and battery, only calculate it once
+        df_pvd = self._calc_pvd()
+        self.df_pff_pv = self._calc_pff(itc_type=' - PV', df_pvd=df_pvd)
+        self.df_pff_batt = self._calc_pff(itc_type=' - Battery', df_pvd=df_pvd)
         self.df_lcoe = self._calc_lcoe()
 
 class CspProc(TechProcessor):
@@ -249,18 +266,22 @@ class GeothermalProc(TechProcessor):
         @param return_short_df - return original 6 row data frame if True
         @returns - CFF data frame
         """
-        df_cff = extractor.get_cff(cff_name, len(cls.scenarios) * 2)
-        assert len(df_cff) == len(cls.scenarios * 2),\
-            (f'Wrong number of CFF rows found. Expected {len(cls.scenarios) * 2}, '
+        expected_rows = len(cls.scenarios) * 2
+        df_cff = extractor.get_cff(cff_name, expected_rows)
+        assert len(df_cff) == expected_rows,\
+            (f'Wrong number of CFF rows found. Expected {expected_rows}, '
             f'get {len(df_cff)}.')
 
         if return_short_df:
             return df_cff
 
-        hydro = df_cff.iloc[0:3]
-        egs = df_cff.iloc[3:6]
+        # Hydro CFF is used by the first two tech details and EGS by the last four. Gather all
+        # rows in a single take.
+        hydro_rows = np.arange(len(cls.scenarios))
+        egs_rows = hydro_rows + len(cls.scenarios)
+        rows = np.concatenate([np.tile(hydro_rows, 2), np.tile(egs_rows, 4)])
 
-        full_df_cff = pd.concat([hydro, hydro, egs, egs, egs, egs])
+        full_df_cff = df_cff.iloc[rows]
         full_df_cff.index = index
         assert len(full_df_cff) == cls.num_tds * len(cls.scenarios)
 
@@ -291,49 +312,56 @@ class PumpedStorageHydroProc(TechProcessor):
     has_tax_credit = False
     has_lcoe = False
 
-    flat_attrs = [
+    flat_attrs = (
         ('df_occ', 'OCC'),
         ('df_gcc', 'GCC'),
         ('df_fom', 'Fixed O&M'),
         ('df_vom', 'Variable O&M'),
         ('df_cfc', 'CFC'),
         ('df_capex', 'CAPEX'),
-    ]
+    )
 
-    metrics = [
+    metrics = (
         ('Overnight Capital Cost ($/kW)', 'df_occ'),
         ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
         ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
         ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
         ('Construction Finance Factor', 'df_cff'),
-    ]
+    )
 
 class PumpedStorageHydroOneResProc(PumpedStorageHydroProc):
     sheet_name = 'PSH One New Res'
     num_tds = 5
 
+
+# Coal and natural gas share the same metrics and outputs
+_FOSSIL_METRICS = (
+    ('Heat Rate (MMBtu/MWh)', 'df_hr'),
+    ('Overnight Capital Cost ($/kW)', 'df_occ'),
+    ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
+    ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
+    ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
+    ('Construction Finance Factor', 'df_cff'),
+)
+
+_FOSSIL_FLAT_ATTRS = (
+    ('df_hr', 'Heat Rate'),
+    ('df_occ', 'OCC'),
+    ('df_gcc', 'GCC'),
+    ('df_fom', 'Fixed O&M'),
+    ('df_vom', 'Variable O&M'),
+    ('df_cfc', 'CFC'),
+    ('df_capex', 'CAPEX'),
+)
+
+
 class CoalProc(TechProcessor):
     tech_name = 'Coal_FE'
     tech_life = 75
 
-    metrics = [
-        ('Heat Rate (MMBtu/MWh)', 'df_hr'),
-        ('Overnight Capital Cost ($/kW)', 'df_occ'),
-        ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
-        ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
-        ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
-        ('Construction Finance Factor', 'df_cff'),
-    ]
+    metrics = _FOSSIL_METRICS
 
-    flat_attrs = [
-        ('df_hr', 'Heat Rate'),
-        ('df_occ', 'OCC'),
-        ('df_gcc', 'GCC'),
-        ('df_fom', 'Fixed O&M'),
-        ('df_vom', 'Variable O&M'),
-        ('df_cfc', 'CFC'),
-        ('df_capex', 'CAPEX'),
-    ]
+    flat_attrs = _FOSSIL_FLAT_ATTRS
 
     sheet_name = 'Coal_FE'
     num_tds = 5
@@ -348,24 +376,9 @@ class NaturalGasProc(TechProcessor):
     tech_name = 'NaturalGas_FE'
     tech_life = 55
 
-    metrics = [
-        ('Heat Rate (MMBtu/MWh)', 'df_hr'),
-        ('Overnight Capital Cost ($/kW)', 'df_occ'),
-        ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
-        ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
-        ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
-        ('Construction Finance Factor', 'df_cff'),
-    ]
+    metrics = _FOSSIL_METRICS
 
-    flat_attrs = [
-        ('df_hr', 'Heat Rate'),
-        ('df_occ', 'OCC'),
-        ('df_gcc', 'GCC'),
-        ('df_fom', 'Fixed O&M'),
-        ('df_vom', 'Variable O&M'),
-        ('df_cfc', 'CFC'),
-        ('df_capex', 'CAPEX'),
-    ]
+    flat_attrs = _FOSSIL_FLAT_ATTRS
     sheet_name = 'Natural Gas_FE'
     num_tds = 10
     has_tax_credit = False
@@ -387,6 +400,26 @@ class NaturalGasFuelCellProc(NaturalGasProc):
     base_year = 2035
 
 
+# Coal and natural gas retrofits share the same metrics and outputs
+_RETROFIT_METRICS = (
+    ('Heat Rate (MMBtu/MWh)', 'df_hr'),
+    ('Additional Overnight Capital Cost ($/kW)', 'df_occ'),
+    ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
+    ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
+    ('Heat Rate Penalty (Δ% from pre-retrofit)' , 'df_hrp'),
+    ('Net Output Penalty (Δ% from pre-retrofit)' , 'df_nop')
+)
+
+_RETROFIT_FLAT_ATTRS = (
+    ('df_hr', 'Heat Rate'),
+    ('df_occ', 'Additional OCC'),
+    ('df_fom', 'Fixed O&M'),
+    ('df_vom', 'Variable O&M'),
+    ('df_hrp', 'Heat Rate Penalty'),
+    ('df_nop', 'Net Output Penalty')
+)
+
+
 class CoalRetrofitProc(TechProcessor):
     tech_name = 'Coal_Retrofits'
     tech_life = 75
@@ -396,23 +429,9 @@ class CoalRetrofitProc(TechProcessor):
     has_capex = False
     has_fin_assump = False
 
-    metrics = [
-        ('Heat Rate (MMBtu/MWh)', 'df_hr'),
-        ('Additional Overnight Capital Cost ($/kW)', 'df_occ'),
-        ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
-        ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
-        ('Heat Rate Penalty (Δ% from pre-retrofit)' , 'df_hrp'),
-        ('Net Output Penalty (Δ% from pre-retrofit)' , 'df_nop')
-    ]
+    metrics = _RETROFIT_METRICS
 
-    flat_attrs = [
-        ('df_hr', 'Heat Rate'),
-        ('df_occ', 'Additional OCC'),
-        ('df_fom', 'Fixed O&M'),
-        ('df_vom', 'Variable O&M'),
-        ('df_hrp', 'Heat Rate Penalty'),
-        ('df_nop', 'Net Output Penalty')
-    ]
+    flat_attrs = _RETROFIT_FLAT_ATTRS
 
     sheet_name = 'Coal_Retrofits'
     num_tds = 2
@@ -428,29 +447,41 @@ class NaturalGasRetrofitProc(TechProcessor):
     has_capex = False
     has_fin_assump = False
 
-    metrics = [
-        ('Heat Rate (MMBtu/MWh)', 'df_hr'),
-        ('Additional Overnight Capital Cost ($/kW)', 'df_occ'),
-        ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
-        ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
-        ('Heat Rate Penalty (Δ% from pre-retrofit)' , 'df_hrp'),
-        ('Net Output Penalty (Δ% from pre-retrofit)' , 'df_nop')
-    ]
+    metrics = _RETROFIT_METRICS
 
-    flat_attrs = [
-        ('df_hr', 'Heat Rate'),
-        ('df_occ', 'Additional OCC'),
-        ('df_fom', 'Fixed O&M'),
-        ('df_vom', 'Variable O&M'),
-        ('df_hrp', 'Heat Rate Penalty'),
-        ('df_nop', 'Net Output Penalty')
-    ]
+    flat_attrs = _RETROFIT_FLAT_ATTRS
 
     sheet_name = 'Natural Gas_Retrofits'
     num_tds = 4
     has_tax_credit = False
 
 
+# Nuclear and biopower share the same metrics and outputs
+_FUELED_METRICS = (
+    ('Heat Rate (MMBtu/MWh)', 'df_hr'),
+    ('Net Capacity Factor (%)', 'df_ncf'),
+    ('Overnight Capital Cost ($/kW)', 'df_occ'),
+    ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
+    ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
+    ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
+    ('Fuel Costs ($/MMBtu)', 'df_fuel_costs_mmbtu'),
+    ('Construction Finance Factor', 'df_cff'),
+)
+
+_FUELED_FLAT_ATTRS = (
+    ('df_ncf', 'CF'),
+    ('df_occ', 'OCC'),
+    ('df_gcc', 'GCC'),
+    ('df_fom', 'Fixed O&M'),
+    ('df_vom', 'Variable O&M'),
+    ('df_cfc', 'CFC'),
+    ('df_lcoe', 'LCOE'),
+    ('df_capex', 'CAPEX'),
+    ('df_fuel_costs_mwh', 'Fuel'),
+    ('df_hr', 'Heat Rate'),
+)
+
+
 class NuclearProc(TechProcessor):
     tech_name = 'Nuclear'
     tech_life = 60
@@ -460,29 +491,9 @@ class NuclearProc(TechProcessor):
     dscr = 1.45
     base_year = 2030
 
-    metrics = [
-        ('Heat Rate (MMBtu/MWh)', 'df_hr'),
-        ('Net Capacity Factor (%)', 'df_ncf'),
-        ('Overnight Capital Cost ($/kW)', 'df_occ'),
-        ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
-        ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
-        ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
-        ('Fuel Costs ($/MMBtu)', 'df_fuel_costs_mmbtu'),
-        ('Construction Finance Factor', 'df_cff'),
-    ]
+    metrics = _FUELED_METRICS
 
-    flat_attrs = [
-        ('df_ncf', 'CF'),
-        ('df_occ', 'OCC'),
-        ('df_gcc', 'GCC'),
-        ('df_fom', 'Fixed O&M'),
-        ('df_vom', 'Variable O&M'),
-        ('df_cfc', 'CFC'),
-        ('df_lcoe', 'LCOE'),
-        ('df_capex', 'CAPEX'),
-        ('df_fuel_costs_mwh', 'Fuel'),
-        ('df_hr', 'Heat Rate'),
-    ]
+    flat_attrs = _FUELED_FLAT_ATTRS
 
     @classmethod
     def load_cff(cls, extractor: Extractor, cff_name: str, index: pd.Index,
@@ -501,7 +512,8 @@ class NuclearProc(TechProcessor):
         """ Include fuel costs in LCOE """
         # pylint: disable=no-member,attribute-defined-outside-init
         self.df_fuel_costs_mwh = self.df_hr * self.df_fuel_costs_mmbtu
-        df_lcoe = super()._calc_lcoe() + self.df_fuel_costs_mwh
+        df_lcoe = super()._calc_lcoe()
+        df_lcoe += self.df_fuel_costs_mwh.to_numpy(dtype=float)
         return df_lcoe
 
     def get_depreciation_schedule(self, year):
@@ -519,35 +531,16 @@ class BiopowerProc(TechProcessor):
     default_tech_detail = 'Biopower - Dedicated'
     dscr = 1.45
 
-    metrics = [
-        ('Heat Rate (MMBtu/MWh)', 'df_hr'),
-        ('Net Capacity Factor (%)', 'df_ncf'),
-        ('Overnight Capital Cost ($/kW)', 'df_occ'),
-        ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
-        ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
-        ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
-        ('Fuel Costs ($/MMBtu)', 'df_fuel_costs_mmbtu'),
-        ('Construction Finance Factor', 'df_cff'),
-    ]
+    metrics = _FUELED_METRICS
 
-    flat_attrs = [
-        ('df_ncf', 'CF'),
-        ('df_occ', 'OCC'),
-        ('df_gcc', 'GCC'),
-        ('df_fom', 'Fixed O&M'),
-        ('df_vom', 'Variable O&M'),
-        ('df_cfc', 'CFC'),
-        ('df_lcoe', 'LCOE'),
-        ('df_capex', 'CAPEX'),
-        ('df_fuel_costs_mwh', 'Fuel'),
-        ('df_hr', 'Heat Rate'),
-    ]
+    flat_attrs = _FUELED_FLAT_ATTRS
 
     def _calc_lcoe(self):
         """ Include fuel costs in LCOE """
         # pylint: disable=no-member,attribute-defined-outside-init
         self.df_fuel_costs_mwh = self.df_hr * self.df_fuel_costs_mmbtu
-        df_lcoe = super()._calc_lcoe() + self.df_fuel_costs_mwh
+        df_lcoe = super()._calc_lcoe()
+        df_lcoe += self.df_fuel_costs_mwh.to_numpy(dtype=float)
         return df_lcoe
 
 
@@ -562,22 +555,22 @@ class AbstractBatteryProc(TechProcessor):
     # This is false because the ATB does not calculate LCOS (batteries can receive the ITC).
     has_tax_credit = False
 
-    metrics = [
+    metrics = (
         ('Overnight Capital Cost ($/kW)', 'df_occ'),
         ('Grid Connection Costs (GCC) ($/kW)', 'df_gcc'),
         ('Fixed Operation and Maintenance Expenses ($/kW-yr)', 'df_fom'),
         ('Variable Operation and Maintenance Expenses ($/MWh)', 'df_vom'),
         ('Construction Finance Factor', 'df_cff'),
-    ]
+    )
 
-    flat_attrs = [
+    flat_attrs = (
         ('df_occ', 'OCC'),
         ('df_gcc', 'GCC'),
         ('df_fom', 'Fixed O&M'),
         ('df_vom', 'Variable O&M'),
         ('df_cfc', 'CFC'),
         ('df_capex', 'CAPEX'),
-    ]
+    )
 
 
 class UtilityBatteryProc(AbstractBatteryProc):
@@ -614,3 +607,6 @@ ALL_TECHS: List[Type[TechProcessor]]= [
 
 # All technologies that have an LCOE
 LCOE_TECHS = [Tech for Tech in ALL_TECHS if Tech.has_lcoe]
+
+# Processors by class name. tech_name is shared by some processors and can't be used as a key.
+TECH_MAP: Dict[str, Type[TechProcessor]] = {Tech.__name__: Tech for Tech in ALL_TECHS}
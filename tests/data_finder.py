@@ -15,7 +15,7 @@ Find path to test data CSV files. General layout:
     ./data/{tech}/{case}/{crp}/df_occ.csv
     ./data/{tech}/{case}/{crp}/etc
 """
-from typing import Optional, Type
+from typing import Dict, Optional, Set, Tuple, Type
 import os
 from lcoe_calculator.base_processor import TechProcessor
 from lcoe_calculator.config import LCOE_SS_NAME, CAPEX_SS_NAME, CrpChoiceType
@@ -36,6 +36,10 @@ class DataFinder:
     be used before first use and before being used for a new tech.
     """
     _tech: Optional[Type[TechProcessor]] = None
+    _metric_lookup: Dict[str, str] = {}
+    _created_dirs: Set[str] = set()
+    # Cache of file names, keyed by (tech, metric, case, crp)
+    _filename_cache: Dict[Tuple[Type[TechProcessor], str, str, CrpChoiceType], str] = {}
 
     @classmethod
     def set_tech(cls, tech: Type[TechProcessor]):
@@ -46,10 +50,22 @@ class DataFinder:
         """
         cls._tech = tech
 
+        # Create a lookup table between fancy long names in the workbook and names to use for the
+        # data files. This table partially borrows from the metrics list.
+        cls._metric_lookup = {
+            LCOE_SS_NAME: 'df_lcoe',
+            CAPEX_SS_NAME: 'df_capex',
+            FIN_ASSUMP_FAKE_SS_NAME: 'df_fin_assump',
+            WACC_FAKE_SS_NAME: 'df_wacc',
+            JUST_WACC_FAKE_SS_NAME: 'df_just_wacc',
+            TAX_CREDIT_FAKE_SS_NAME: 'df_tc',
+        }
+        cls._metric_lookup.update(tech.metrics)
+
     @classmethod
-    def get_data_filename(cls, metric: str, case: str, crp: CrpChoiceType):
+    def get_data_filename(cls, metric: str, case: str, crp: CrpChoiceType) -> str:
         """
-        Get path and filename to test data.
+        Get path and filename to test data. Results are cached per tech.
 
         @param metric - long name of desired metric, e.g.: 'CAPEX ($/kW)'
         @param case - name of desired financial case
@@ -58,38 +74,51 @@ class DataFinder:
         """
         assert cls._tech is not None, 'The TechProcessor must be set first with set_tech().'
 
-        # Create a lookup table between fancy long names in the workbook and names to use for the
-        # data files. This table partially borrows from the metrics list.
-        metric_lookup = list(cls._tech.metrics)
-        metric_lookup += [
-            (LCOE_SS_NAME, 'df_lcoe'),
-            (CAPEX_SS_NAME, 'df_capex'),
-            (FIN_ASSUMP_FAKE_SS_NAME, 'df_fin_assump'),
-            (WACC_FAKE_SS_NAME, 'df_wacc'),
-            (JUST_WACC_FAKE_SS_NAME, 'df_just_wacc'),
-            (TAX_CREDIT_FAKE_SS_NAME, 'df_tc'),
-        ]
-        assert metric in [m[0] for m in metric_lookup],\
+        key = (cls._tech, metric, case, crp)
+        if key not in cls._filename_cache:
+            cls._filename_cache[key] = cls._find_data_filename(metric, case, crp)
+        return cls._filename_cache[key]
+
+    @classmethod
+    def _find_data_filename(cls, metric: str, case: str, crp: CrpChoiceType) -> str:
+        """
+        Build path and filename to test data for the current tech, creating directories as needed.
+
+        @param metric - long name of desired metric, e.g.: 'CAPEX ($/kW)'
+        @param case - name of desired financial case
+        @param crp - name of desired CRP
+        @returns path to CSV file for metric in testing data dir
+        """
+        assert metric in cls._metric_lookup,\
             f'metric {metric} is not known for sheet {cls._tech.sheet_name}'
-        df_name = [m[1] for m in metric_lookup if m[0] == metric][0]
+        df_name = cls._metric_lookup[metric]
 
         # Files in ./data/{tech}
         clean_sheet_name = str(cls._tech.sheet_name).replace(' ', '_')
         tech_dir = os.path.join(DATA_DIR, clean_sheet_name)
-        if not os.path.exists(tech_dir):
-            os.makedirs(tech_dir)
+        cls._make_dir(tech_dir)
         if df_name in ['df_ncf']:
             return os.path.join(tech_dir, f'{df_name}.csv')
 
         # Files in ./data/{tech}/{case}
         case_dir = os.path.join(tech_dir, case)
-        if not os.path.exists(case_dir):
-            os.makedirs(case_dir)
+        cls._make_dir(case_dir)
         if df_name in ['df_cff', 'df_wacc', 'df_just_wacc']:
             return os.path.join(case_dir, f'{df_name}.csv')
 
         # Files in ./data/{tech}/{case}/{crp}
         crp_dir = os.path.join(case_dir, str(crp))
-        if not os.path.exists(crp_dir):
-            os.makedirs(crp_dir)
+        cls._make_dir(crp_dir)
         return os.path.join(crp_dir, f'{df_name}.csv')
+
+    @classmethod
+    def _make_dir(cls, path: str):
+        """
+        Create directory if it does not exist. Directories that have already been created or
+        found are remembered so the file system is only checked once per directory.
+
+        @param path - directory to create
+        """
+        if path not in cls._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            cls._created_dirs.add(path)
@@ -7,11 +7,11 @@
 """
 Extract values from the data workbook and save to the tests data directory.
 """
-from typing import Dict, Type
+from typing import Type
 import click
 
 from lcoe_calculator.base_processor import TechProcessor
-from lcoe_calculator.tech_processors import ALL_TECHS
+from lcoe_calculator.tech_processors import ALL_TECHS, TECH_MAP
 from lcoe_calculator.extractor import Extractor
 from lcoe_calculator.config import FINANCIAL_CASES, LCOE_SS_NAME, CAPEX_SS_NAME, CFF_SS_NAME,\
     CRP_CHOICES, CrpChoiceType
@@ -40,14 +40,17 @@ def extract_data_for_crp_case(data_workbook_fname: str, tech: Type[TechProcessor
     if tech.has_capex:
         metrics.append((CAPEX_SS_NAME, ''))
 
+    index = None
     extract_cff = False
-    for metric, _ in metrics :
+    for metric, _ in metrics:
         if metric == CFF_SS_NAME:
             extract_cff = True
             continue
 
         df = extractor.get_metric_values(metric, tech.num_tds, tech.split_metrics)
-        index = df.index
+        if index is None:
+            # Use the index of the first metric for the CFF, same as TechProcessor
+            index = df.index
         fname = DataFinder.get_data_filename(metric, case, crp)
         df.to_csv(fname)
 
@@ -74,7 +77,7 @@ def extract_data_for_crp_case(data_workbook_fname: str, tech: Type[TechProcessor
         df_tc.to_csv(fname)
 
 
-tech_names = [tech.__name__ for tech in ALL_TECHS]
+tech_names = tuple(TECH_MAP)
 
 @click.command
 @click.argument('filename', type=click.Path(exists=True))
@@ -84,12 +87,10 @@ def extract(filename: str, tech: str|None):
     Extract test data for one or more techs for all CRPs and financial cases. Data will be extracted
     from the Excel ATB data workbook FILENAME and saved as CSV for testing.
     """
-    tech_map: Dict[str, Type[TechProcessor]] = {tech.__name__: tech for tech in ALL_TECHS}
-
     if tech is None:
         techs = ALL_TECHS
     else:
-        techs = [tech_map[tech]]
+        techs = [TECH_MAP[tech]]
 
     for Tech in techs:
         print(f'Extracting values for {Tech.sheet_name}')
@@ -8,6 +8,7 @@
 Mock data extractor for testing.
 """
 from typing import List, Optional, Tuple
+from functools import lru_cache
 import pandas as pd
 from lcoe_calculator.abstract_extractor import AbstractExtractor
 from lcoe_calculator.config import CrpChoiceType
@@ -75,7 +76,7 @@ class MockExtractor(AbstractExtractor):
         tech sheet and return as data frame
         """
         fname = DataFinder.get_data_filename(FIN_ASSUMP_FAKE_SS_NAME, self._case, self._requested_crp)
-        df = pd.read_csv(fname, index_col=0)
+        df = _read_csv(fname, int_columns=False).copy()
         return df
 
     def get_wacc(self, _=None) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -96,11 +97,25 @@ class MockExtractor(AbstractExtractor):
     @staticmethod
     def read_csv(fname: str) -> pd.DataFrame:
         """
-        Read a CSV and convert columns to ints
+        Read a CSV and convert columns to ints. Each file is only parsed once, a copy is returned
+        as processors may modify the data frames they load.
 
         @param fname - file to read
         @returns data in the CSV
         """
-        df = pd.read_csv(fname, index_col=0)
+        return _read_csv(fname).copy()
+
+
+@lru_cache(maxsize=None)
+def _read_csv(fname: str, int_columns: bool = True) -> pd.DataFrame:
+    """
+    Read and cache a CSV. The returned data frame is shared and must not be modified.
+
+    @param fname - file to read
+    @param int_columns - convert columns to ints if True
+    @returns data in the CSV
+    """
+    df = pd.read_csv(fname, index_col=0)
+    if int_columns:
         df.columns = df.columns.astype(int)
-        return df
+    return df
@@ -13,96 +13,63 @@ from debt_fraction_calculator.debt_fraction_calc import calculate_debt_fraction
 from lcoe_calculator.macrs import MACRS_6, MACRS_16, MACRS_21
 
 
-def test_no_tax_credits():
-    """ 2023 ATB utility PV, 2030, R&D case """
-    input_vals = {
-        "CF" : 0.29485,
-        "OCC" : 1043.0,
-        "CFC" : 38.0,
-        "Fixed O&M" : 18.0,
-        "Variable O&M" : 0.0,
-        "DSCR" : 1.3,
-        "Rate of Return on Equity Nominal" : 0.088,
-        "Tax Rate (Federal and State)" : 0.257,
-        "Inflation Rate" : 0.025,
-        "Interest Rate Nominal" : 0.07,
-        "Calculated Rate of Return on Equity Real" : 0.061,
-        "ITC" : 0,
-        "PTC" : 0,
-        "MACRS" : MACRS_6
-    }
+# 2023 ATB utility PV, 2030
+UTILITY_PV_2030 = {
+    "CF" : 0.29485,
+    "OCC" : 1043.0,
+    "CFC" : 38.0,
+    "Fixed O&M" : 18.0,
+    "Variable O&M" : 0.0,
+    "DSCR" : 1.3,
+    "Rate of Return on Equity Nominal" : 0.088,
+    "Tax Rate (Federal and State)" : 0.257,
+    "Inflation Rate" : 0.025,
+    "Interest Rate Nominal" : 0.07,
+    "Calculated Rate of Return on Equity Real" : 0.061,
+    "ITC" : 0,
+    "PTC" : 0,
+    "MACRS" : MACRS_6
+}
 
-    debt_frac = calculate_debt_fraction(input_vals)
-
-    assert debt_frac == pytest.approx(73.8, 0.1)
-
-def test_ptc():
-    """ 2023 ATB utility PV, 2030, Markets case """
-    input_vals = {
-        "CF" : 0.29485,
-        "OCC" : 1043.0,
-        "CFC" : 38.0,
-        "Fixed O&M" : 18.0,
-        "Variable O&M" : 0.0,
-        "DSCR" : 1.3,
-        "Rate of Return on Equity Nominal" : 0.088,
-        "Tax Rate (Federal and State)" : 0.257,
-        "Inflation Rate" : 0.025,
-        "Interest Rate Nominal" : 0.07,
-        "Calculated Rate of Return on Equity Real" : 0.061,
-        "ITC" : 0,
-        "PTC" : 25.46,
-        "MACRS" : MACRS_6
-    }
-
-    debt_frac = calculate_debt_fraction(input_vals)
-
-    assert debt_frac == pytest.approx(45.5, 0.1)
+# Nuclear, 2030
+NUCLEAR_2030 = {
+    "CF" : 0.93,
+    "OCC" : 6115.0,
+    "CFC" : 1615.0,
+    "Fixed O&M" : 152.0,
+    "Variable O&M" : 2.0,
+    "DSCR" : 1.45,
+    "Rate of Return on Equity Nominal" : 0.11,
+    "Tax Rate (Federal and State)" : 0.257,
+    "Inflation Rate" : 0.025,
+    "Interest Rate Nominal" : 0.08,
+    "Calculated Rate of Return on Equity Real" : 0.083,
+    "ITC" : 0.3,
+    "PTC" : 0,
+    "MACRS" : MACRS_6,
+    "Fuel" : 7.0,
+    "Heat Rate" : 10.45
+}
 
-def test_itc():
-    """ 2023 ATB utility PV, 2030, Markets case """
-    input_vals = {
-        "CF" : 0.29485,
-        "OCC" : 1043.0,
-        "CFC" : 38.0,
-        "Fixed O&M" : 18.0,
-        "Variable O&M" : 0.0,
-        "DSCR" : 1.3,
-        "Rate of Return on Equity Nominal" : 0.088,
-        "Tax Rate (Federal and State)" : 0.257,
-        "Inflation Rate" : 0.025,
-        "Interest Rate Nominal" : 0.07,
-        "Calculated Rate of Return on Equity Real" : 0.061,
-        "ITC" : 0.3,
-        "PTC" : 0,
-        "MACRS" : MACRS_6
-    }
-
-    debt_frac = calculate_debt_fraction(input_vals)
+# (input values, expected debt fraction)
+TEST_CASES = [
+    # R&D case
+    pytest.param(UTILITY_PV_2030, 73.8, id='no_tax_credits'),
+    # Markets case
+    pytest.param({**UTILITY_PV_2030, "PTC" : 25.46}, 45.5, id='ptc'),
+    pytest.param({**UTILITY_PV_2030, "ITC" : 0.3}, 51.8, id='itc'),
+    pytest.param(NUCLEAR_2030, 48.9, id='heat_rate'),
+]
 
-    assert debt_frac == pytest.approx(51.8, 0.1)
 
-def test_heat_rate():
-    """ Nuclear, 2030 """
-    input_vals = {
-        "CF" : 0.93,
-        "OCC" : 6115.0,
-        "CFC" : 1615.0,
-        "Fixed O&M" : 152.0,
-        "Variable O&M" : 2.0,
-        "DSCR" : 1.45,
-        "Rate of Return on Equity Nominal" : 0.11,
-        "Tax Rate (Federal and State)" : 0.257,
-        "Inflation Rate" : 0.025,
-        "Interest Rate Nominal" : 0.08,
-        "Calculated Rate of Return on Equity Real" : 0.083,
-        "ITC" : 0.3,
-        "PTC" : 0,
-        "MACRS" : MACRS_6,
-        "Fuel" : 7.0,
-        "Heat Rate" : 10.45
-    }
+@pytest.mark.parametrize('input_vals,expected', TEST_CASES)
+def test_debt_fraction(input_vals, expected):
+    """
+    Test debt fraction calculation against values from the ATB workbook
 
+    @param input_vals - input values for debt fraction calculator
+    @param expected - expected debt fraction (%)
+    """
     debt_frac = calculate_debt_fraction(input_vals)
 
-    assert debt_frac == pytest.approx(48.9, 0.1)
+    assert debt_frac == pytest.approx(expected, 0.1)
@@ -9,6 +9,7 @@ Test that the LCOE and CAPEX processing code works properly.
 """
 import numpy as np
 import pandas as pd
+import pytest
 
 from lcoe_calculator.base_processor import CRP_CHOICES
 from lcoe_calculator.tech_processors import ALL_TECHS, TechProcessor
@@ -17,47 +18,63 @@ from lcoe_calculator.config import FINANCIAL_CASES
 from .mock_extractor import MockExtractor
 from .data_finder import DataFinder
 
-def test_lcoe_and_capex_calculations():
+TEST_PARAMS = [(Tech, case, crp) for Tech in ALL_TECHS for case in FINANCIAL_CASES
+               for crp in CRP_CHOICES]
+
+
+def _param_id(param):
+    """ Use the class name for tech processors in test IDs """
+    return param.__name__ if isinstance(param, type) else str(param)
+
+
+def _has_nan(df: pd.DataFrame) -> bool:
+    """ Check for any missing values in a numeric data frame with a single reduction """
+    return np.isnan(df.to_numpy(dtype=float, copy=False)).any()
+
+
+@pytest.mark.parametrize('Tech,case,crp', TEST_PARAMS, ids=_param_id)
+def test_lcoe_and_capex_calculations(Tech, case, crp):
     """
     Test LCOE and CAPEX calculations using stored data
+
+    @param Tech - tech processor class to test
+    @param case - financial case
+    @param crp - capital recovery period
     """
-    for Tech in ALL_TECHS:
-        print(f'----------- Testing {Tech.sheet_name} -----------')
-        for case in FINANCIAL_CASES:
-            for crp in CRP_CHOICES:
-                DataFinder.set_tech(Tech)
-
-                proc: TechProcessor = Tech('fake_path_to_data_workbook.xlsx', case=case, crp=crp,
-                                           extractor=MockExtractor)
-                proc.run()
-
-                # Check all metrics have been loaded
-                for metric in proc.metrics:
-                    df = getattr(proc, metric[1])
-                    assert isinstance(df, pd.DataFrame)
-                    assert not df.isnull().any().any()
-
-                # Check all data for export has been loaded or calculated
-                for flat_attr in proc.flat_attrs:
-                    df = getattr(proc, flat_attr[0])
-                    assert isinstance(df, pd.DataFrame)
-                    assert not df.isnull().any().any()
-
-                # Compare python calculated CAPEX and LCOE to values originally calculated in the
-                # workbook.
-                if proc.has_capex:
-                    proc.test_capex()
-                    assert not proc.df_capex.isnull().any().any()
-                    assert not proc.ss_capex.isnull().any().any()
-                    assert np.allclose(np.array(proc.df_capex, dtype=float),
-                                    np.array(proc.ss_capex, dtype=float))
-                if proc.has_lcoe:
-                    proc.test_lcoe()
-                    assert not proc.df_lcoe.isnull().any().any()
-                    assert not proc.ss_lcoe.isnull().any().any()
-                    assert np.allclose(np.array(proc.df_lcoe, dtype=float),
-                                    np.array(proc.ss_lcoe, dtype=float))
+    DataFinder.set_tech(Tech)
+
+    proc: TechProcessor = Tech('fake_path_to_data_workbook.xlsx', case=case, crp=crp,
+                               extractor=MockExtractor)
+    proc.run()
+
+    # Check all metrics have been loaded
+    for metric in proc.metrics:
+        df = getattr(proc, metric[1])
+        assert isinstance(df, pd.DataFrame)
+        assert not _has_nan(df)
+
+    # Check all data for export has been loaded or calculated
+    for flat_attr in proc.flat_attrs:
+        df = getattr(proc, flat_attr[0])
+        assert isinstance(df, pd.DataFrame)
+        assert not _has_nan(df)
+
+    # Compare python calculated CAPEX and LCOE to values originally calculated in the
+    # workbook.
+    if proc.has_capex:
+        proc.test_capex()
+        assert not _has_nan(proc.df_capex)
+        assert not _has_nan(proc.ss_capex)
+        assert proc.df_capex.shape == proc.ss_capex.shape
+        assert np.allclose(proc.df_capex.to_numpy(dtype=float), proc.ss_capex.to_numpy(dtype=float))
+    if proc.has_lcoe:
+        proc.test_lcoe()
+        assert not _has_nan(proc.df_lcoe)
+        assert not _has_nan(proc.ss_lcoe)
+        assert proc.df_lcoe.shape == proc.ss_lcoe.shape
+        assert np.allclose(proc.df_lcoe.to_numpy(dtype=float), proc.ss_lcoe.to_numpy(dtype=float))
 
 
 if __name__ == '__main__':
-    test_lcoe_and_capex_calculations()
+    for params in TEST_PARAMS:
+        test_lcoe_and_capex_calculations(*params)